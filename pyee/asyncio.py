@@ -85,8 +85,8 @@ class AsyncIOEventEmitter(EventEmitter):
     coroutine is scheduled in a fire-and-forget fashion.
     """
 
-    def __init__(self, loop = None):
-        super(AsyncIOEventEmitter, self).__init__()
+    def __init__(self, loop = None, threadsafe: bool = True):
+        super(AsyncIOEventEmitter, self).__init__(threadsafe=threadsafe)
         self._loop = loop
         self._waiting: set = set()
 
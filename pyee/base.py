@@ -1,9 +1,33 @@
 # -*- coding: utf-8 -*-
 
-from collections import OrderedDict
-# from threading import Lock
-import threading
-Lock = threading._thread.allocate_lock
+
+class _NullLock:
+    """A lock that does nothing, for emitters that are only ever used from
+    a single thread."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_LOCK = _NullLock()
+
+try:
+    from _thread import allocate_lock as Lock
+except ImportError:
+    # Builds without thread support can't have concurrent emitters
+    Lock = _NullLock
+
+# Guards the lazy creation of per-emitter locks
+_INIT_LOCK = Lock()
+
+# Shared by every emitter with no listeners yet. Never mutate it: emitters
+# swap in their own dict before adding a listener
+_NO_EVENTS: dict = {}
 
 class PyeeException(Exception):
     """An exception internal to pyee. Deprecated in favor of PyeeError."""
@@ -16,6 +40,48 @@ class PyeeError(PyeeException):
 # Handler = TypeVar("Handler", bound=Callable)
 Handler = None
 
+
+class _OnceWrapper:
+    """Wraps a `once` handler so that it removes itself before being
+    called. A single small object is cheaper than a pair of closures.
+
+    `fired` is set whenever the wrapper stops being registered, whether it
+    fired or was removed, so it can be checked without looking the event up.
+    """
+
+    __slots__ = ("ee", "event", "f", "fired")
+
+    def __init__(self, ee, event: str, f) -> None:
+        self.ee = ee
+        self.event = event
+        self.f = f
+        self.fired = False
+
+    def __call__(
+        self,
+        *args,
+        **kwargs,
+    ):
+        if self.fired:
+            return None
+        ee = self.ee
+        with ee._get_lock():
+            # Check that we weren't removed already right before the lock
+            if self.fired:
+                return None
+            ee._remove_listener(self.event, self.f)
+        # f may return a coroutine, so we need to return that
+        # result here so that emit can schedule it
+        return self.f(*args, **kwargs)
+
+
+def _retire(v) -> None:
+    """Mark the handler `v` as no longer registered, if it's a `once`
+    wrapper."""
+    if isinstance(v, _OnceWrapper):
+        v.fired = True
+
+
 class EventEmitter:
     """The base event emitter class. All other event emitters inherit from
     this class.
@@ -43,20 +109,71 @@ class EventEmitter:
     All callbacks are handled in a synchronous, blocking manner. As in node.js,
     raised exceptions are not automatically handled for you---you must catch
     your own exceptions, and treat them accordingly.
+
+    Emitting does not take the emitter's lock. Each emit works from a snapshot
+    of the listeners registered when it started, so a listener added or
+    removed from another thread during an emit may or may not be called by
+    that emit. Listeners removed by an earlier listener of the same emit are
+    still called, except for `once` listeners, which are skipped once removed.
+
+    Adding and removing listeners is guarded by a lock. Emitters that are only
+    ever used from a single thread, such as in a MicroPython asyncio
+    application, can skip that overhead with `EventEmitter(threadsafe=False)`.
     """
 
-    def __init__(self) -> None:
-        self._events: dict = dict()
-        self._lock: Lock = Lock()
+    __slots__ = ("_events", "_lock", "_dispatch_is_default", "__weakref__")
+
+    # Events which are passed to _emit_handle_potential_error when emitted
+    # with no listeners. Subclasses whose hook handles other events, such as
+    # a 'failure' event, should add them here
+    _error_events: tuple = ("error",)
+
+    def __init__(self, threadsafe: bool = True) -> None:
+        # Most emitters never get a listener, so the event table and lock are
+        # only allocated once one is added
+        self._events: dict = _NO_EVENTS
+        self._lock = None if threadsafe else _NULL_LOCK
+        # When neither _emit_run nor _call_handlers is overridden, emit can use
+        # the specialized dispatch paths and call handlers directly
+        cls = type(self)
+        self._dispatch_is_default: bool = (
+            cls._emit_run is EventEmitter._emit_run
+            and cls._call_handlers is EventEmitter._call_handlers
+        )
 
     def __getstate__(self) -> dict:
-        state = self.__dict__.copy()
-        del state["_lock"]
+        state = {}
+        # Collect the slots of every class in the hierarchy, since subclasses
+        # may declare their own. MicroPython has no __mro__, but it ignores
+        # __slots__ anyway and keeps everything in __dict__
+        for cls in getattr(type(self), "__mro__", ()):
+            slots = cls.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for k in slots:
+                if k not in ("__dict__", "__weakref__") and hasattr(self, k):
+                    state[k] = getattr(self, k)
+        # Subclasses that don't define __slots__ keep their own attributes in
+        # an instance __dict__
+        state.update(getattr(self, "__dict__", {}))
+        # Real locks can't be pickled, so they're recreated lazily, but a null
+        # lock records that the emitter isn't threadsafe
+        if not isinstance(state["_lock"], _NullLock):
+            state["_lock"] = None
         return state
 
     def __setstate__(self, state: dict) -> None:
-        self.__dict__.update(state)
-        self._lock = Lock()
+        for k, v in state.items():
+            setattr(self, k, v)
+
+    def _get_lock(self):
+        lock = self._lock
+        if lock is None:
+            with _INIT_LOCK:
+                lock = self._lock
+                if lock is None:
+                    lock = self._lock = Lock()
+        return lock
 
     def on(
         self, event: str, f = None
@@ -128,18 +245,61 @@ class EventEmitter:
         self._add_event_handler(event, f, f)
         return f
 
+    def on_many(self, pairs) -> None:
+        """Register each function `f` to its event name `event`, given an
+        iterable of `(event, f)` pairs:
+
+        ```py
+        ee.on_many([("data", data_handler), ("end", end_handler)])
+        ```
+
+        The emitter's lock is taken only once for the whole batch. Unlike
+        calling `ee.on(event, f)` for every pair, `new_listener` fires for all
+        of the pairs before any of them is added, so a `new_listener` handler
+        in the batch isn't told about the other pairs.
+        """
+        pairs = tuple(pairs)
+
+        # Fire 'new_listener' *before* adding any of the new listeners!
+        if "new_listener" in self._events:
+            for event, f in pairs:
+                self.emit("new_listener", event, f)
+
+        add_listener = self._add_listener
+        with self._get_lock():
+            for event, f in pairs:
+                add_listener(event, f, f)
+
     def _add_event_handler(self, event: str, k, v):
         # Fire 'new_listener' *before* adding the new listener!
-        self.emit("new_listener", event, k)
+        if "new_listener" in self._events:
+            self.emit("new_listener", event, k)
 
         # Add the necessary function
         # Note that k and v are the same for `on` handlers, but
         # different for `once` handlers, where v is a wrapped version
         # of k which removes itself before calling k
-        with self._lock:
-            if event not in self._events:
-                self._events[event] = OrderedDict()
-            self._events[event][k] = v
+        with self._get_lock():
+            self._add_listener(event, k, v)
+
+    def _add_listener(self, event: str, k, v) -> None:
+        """Naked unprotected addition."""
+        # Listener tuples are never mutated in place; they're rebuilt under
+        # the lock so that emit can read them without taking it
+        events = self._events
+        if events is _NO_EVENTS:
+            events = self._events = {}
+        funcs = events.get(event, ())
+        # Re-registering a listener replaces it in place, keeping its
+        # original position
+        for i, (key, old) in enumerate(funcs):
+            if key == k:
+                _retire(old)
+                funcs = funcs[:i] + ((k, v),) + funcs[i + 1 :]
+                break
+        else:
+            funcs = funcs + ((k, v),)
+        events[event] = funcs
 
     def _emit_run(
         self,
@@ -150,10 +310,13 @@ class EventEmitter:
         f(*args, **kwargs)
 
     def event_names(self) -> set:
-        """Get a set of events that this emitter is listening to."""
-        return set(self._events.keys())
+        """Get a set of events that this emitter is listening to. The set is a
+        snapshot, and doesn't change as listeners are added or removed."""
+        return set(self._events)
 
     def _emit_handle_potential_error(self, event: str, error) -> None:
+        """Called by `emit` when nothing handled `event`, but only for the
+        events listed in `_error_events`."""
         if event == "error":
             if isinstance(error, Exception):
                 raise error
@@ -166,15 +329,61 @@ class EventEmitter:
         args: tuple,
         kwargs: dict,
     ) -> bool:
-        handled = False
-
-        with self._lock:
-            funcs = list(self._events.get(event, OrderedDict()).values())
-        for f in funcs:
-            self._emit_run(f, args, kwargs)
-            handled = True
-
-        return handled
+        # No lock needed: the tuple is an immutable snapshot, so listeners
+        # added or removed while we iterate don't affect this emit
+        funcs = self._events.get(event)
+        if not funcs:
+            return False
+
+        if not self._dispatch_is_default:
+            emit_run = self._emit_run
+            for _, f in funcs:
+                emit_run(f, args, kwargs)
+        elif kwargs:
+            for _, f in funcs:
+                f(*args, **kwargs)
+        else:
+            for _, f in funcs:
+                f(*args)
+
+        return True
+
+    # Specializations of _call_handlers for the common case of a few
+    # positional arguments, no keyword arguments and neither _emit_run nor
+    # _call_handlers overridden, which avoid unpacking an args tuple for
+    # every handler
+
+    def _call_handlers_0(self, event: str) -> bool:
+        funcs = self._events.get(event)
+        if not funcs:
+            return False
+        for _, f in funcs:
+            f()
+        return True
+
+    def _call_handlers_1(self, event: str, a) -> bool:
+        funcs = self._events.get(event)
+        if not funcs:
+            return False
+        for _, f in funcs:
+            f(a)
+        return True
+
+    def _call_handlers_2(self, event: str, a, b) -> bool:
+        funcs = self._events.get(event)
+        if not funcs:
+            return False
+        for _, f in funcs:
+            f(a, b)
+        return True
+
+    def _call_handlers_3(self, event: str, a, b, c) -> bool:
+        funcs = self._events.get(event)
+        if not funcs:
+            return False
+        for _, f in funcs:
+            f(a, b, c)
+        return True
 
     def emit(
         self,
@@ -195,9 +404,24 @@ class EventEmitter:
         Assuming `data` is an attached function, this will call
         `data('00101001')'`.
         """
-        handled = self._call_handlers(event, args, kwargs)
+        if kwargs or not self._dispatch_is_default:
+            handled = self._call_handlers(event, args, kwargs)
+        else:
+            n = len(args)
+            if n == 0:
+                handled = self._call_handlers_0(event)
+            elif n == 1:
+                handled = self._call_handlers_1(event, args[0])
+            elif n == 2:
+                handled = self._call_handlers_2(event, args[0], args[1])
+            elif n == 3:
+                handled = self._call_handlers_3(event, args[0], args[1], args[2])
+            else:
+                handled = self._call_handlers(event, args, kwargs)
 
-        if not handled:
+        # Only error events need handling when nothing listened, so check
+        # the name before paying for the method call
+        if not handled and event in self._error_events:
             self._emit_handle_potential_error(event, args[0] if args else None)
 
         return handled
@@ -212,22 +436,7 @@ class EventEmitter:
         """
 
         def _wrapper(f):
-            def g(
-                *args,
-                **kwargs,
-            ):
-                with self._lock:
-                    # Check that the event wasn't removed already right
-                    # before the lock
-                    if event in self._events and f in self._events[event]:
-                        self._remove_listener(event, f)
-                    else:
-                        return None
-                # f may return a coroutine, so we need to return that
-                # result here so that emit can schedule it
-                return f(*args, **kwargs)
-
-            self._add_event_handler(event, f, g)
+            self._add_event_handler(event, f, _OnceWrapper(self, event, f))
             return f
 
         if f is None:
@@ -237,25 +446,44 @@ class EventEmitter:
 
     def _remove_listener(self, event: str, f) -> None:
         """Naked unprotected removal."""
-        self._events[event].pop(f)
-        if not len(self._events[event]):
-            del self._events[event]
+        events = self._events
+        funcs = events[event]
+        # Listener counts are almost always tiny, so a linear scan beats
+        # the overhead of a hashed container per event
+        for i, (k, v) in enumerate(funcs):
+            if k == f:
+                _retire(v)
+                funcs = funcs[:i] + funcs[i + 1 :]
+                break
+        else:
+            raise KeyError(f)
+        if funcs:
+            events[event] = funcs
+        else:
+            del events[event]
 
     def remove_listener(self, event: str, f) -> None:
         """Removes the function `f` from `event`."""
-        with self._lock:
+        with self._get_lock():
             self._remove_listener(event, f)
 
     def remove_all_listeners(self, event = None) -> None:
         """Remove all listeners attached to `event`.
         If `event` is `None`, remove all listeners on all events.
         """
-        with self._lock:
+        with self._get_lock():
+            events = self._events
             if event is not None:
-                self._events[event] = OrderedDict()
+                if events is not _NO_EVENTS:
+                    for _, v in events.get(event, ()):
+                        _retire(v)
+                    events[event] = ()
             else:
-                self._events = dict()
+                for funcs in events.values():
+                    for _, v in funcs:
+                        _retire(v)
+                self._events = _NO_EVENTS
 
     def listeners(self, event: str) -> list:
         """Returns a list of all listeners registered to the `event`."""
-        return list(self._events.get(event, OrderedDict()).keys())
+        return [k for k, _ in self._events.get(event, ())]
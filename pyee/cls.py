@@ -1,49 +1,79 @@
 from functools import wraps
 
+try:
+    from types import MethodType
+
+    # micropython-lib's types.MethodType is the built-in bound method type,
+    # which can't be constructed
+    MethodType(lambda self: None, object())
+except (ImportError, TypeError):
+    # MicroPython has no usable MethodType, so bind with a closure
+    def MethodType(method, self):
+        def bound(*args, **kwargs):
+            return method(self, *args, **kwargs)
+
+        return bound
+
 from pyee import EventEmitter
 
 
 class Handler:
     # dataclass
-    def __init__(self, event: str, method):
+    __slots__ = ("event", "method", "order")
+
+    def __init__(self, event: str, method, order: int = 0):
         self.event = event
         self.method = method
+        # Decoration order, since class dicts aren't ordered on MicroPython
+        self.order = order
 
-class Handlers:
-    def __init__(self):
-        self._handlers = []
+    # Until `evented` unwraps it, a Handler stands in for its method, so it
+    # has to stay callable and bind like a function
 
-    def append(self, handler):
-        self._handlers.append(handler)
+    def __call__(self, *args, **kwargs):
+        return self.method(*args, **kwargs)
 
-    def __iter__(self):
-        return iter(self._handlers)
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return MethodType(self, obj)
 
-    def reset(self):
-        self._handlers = []
 
+_order = 0
 
-_handlers = Handlers()
 
 def on(event: str):
     """
     Register an event handler on an evented class. See the `evented` class
     decorator for a full example.
+
+    Other decorators may be applied on top of `on` as long as they expose the
+    function they wrap as `__wrapped__`, as `functools.wraps` does on CPython.
     """
 
     def decorator(method):
-        _handlers.append(Handler(event=event, method=method))
-        return method
+        global _order
+        _order += 1
+        # MicroPython doesn't support attributes on functions, so tag the
+        # method by wrapping it instead. `evented` unwraps it again.
+        return Handler(event=event, method=method, order=_order)
 
     return decorator
 
 
-def _bind(self, method):
-    @wraps(method)
-    def bound(*args, **kwargs):
-        return method(self, *args, **kwargs)
+def _find_handler(value):
+    """Follow `__wrapped__` from `value` down to a Handler, if there is
+    one."""
+    seen = set()
+    while not isinstance(value, Handler):
+        if id(value) in seen:
+            return None
+        seen.add(id(value))
+        value = getattr(value, "__wrapped__", None)
+        if value is None:
+            return None
+    return value
 
-    return bound
 
 def evented(cls):
     """
@@ -89,9 +119,33 @@ def evented(cls):
         async def event_handler(self, *args, **kwargs):
             await self.some_async_action(*args, **kwargs)
     ```
+
+    Handlers are registered in one batch with the emitter's `on_many` method,
+    which doesn't go through `on`, so overriding `on` on a custom emitter has
+    no effect here. Emitters without `on_many` have `on` called once per
+    handler instead.
     """
-    handlers = list(_handlers)
-    _handlers.reset()
+    handlers = []
+    for name, value in list(cls.__dict__.items()):
+        handler = _find_handler(value)
+        if handler is None:
+            continue
+        # Unwrap stacked `on` decorators
+        method = handler
+        stacked = []
+        while isinstance(method, Handler):
+            stacked.append(method)
+            method = method.method
+        for h in stacked:
+            handlers.append(Handler(event=h.event, method=method, order=h.order))
+        # When `on` is outermost, put the plain method back on the class.
+        # Otherwise leave the outer decorator alone; it still calls through
+        # the Handler
+        if handler is value:
+            setattr(cls, name, method)
+    # Register in decoration order rather than class dict order
+    handlers.sort(key=lambda h: h.order)
+    handlers = tuple(handlers)
 
     if hasattr(cls, "__init__"):
         og_init = cls.__init__
@@ -105,8 +159,13 @@ def evented(cls):
         if not hasattr(self, "event_emitter"):
             self.event_emitter = EventEmitter()
 
-        for h in handlers:
-            self.event_emitter.on(h.event, _bind(self, h.method))
+        ee = self.event_emitter
+        on_many = getattr(ee, "on_many", None)
+        if on_many is not None:
+            on_many([(h.event, MethodType(h.method, self)) for h in handlers])
+        else:
+            for h in handlers:
+                ee.on(h.event, MethodType(h.method, self))
 
     cls.__init__ = init
 
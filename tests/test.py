@@ -9,3 +9,26 @@ def event_handler():
     print('BANG BANG')
 
 ee.emit('event')
+
+# A once listener removed by an earlier listener in the same emit is skipped
+
+def once_handler():
+    print('this should not print')
+
+@ee.on('remove')
+def remove_handler():
+    ee.remove_listener('remove', once_handler)
+
+ee.once('remove', once_handler)
+ee.emit('remove')
+print(ee.listeners('remove'))
+
+# The same goes for remove_all_listeners()
+
+@ee.on('remove_all')
+def remove_all_handler():
+    ee.remove_all_listeners()
+
+ee.once('remove_all', once_handler)
+ee.emit('remove_all')
+print(ee.event_names())
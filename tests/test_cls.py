@@ -15,4 +15,37 @@ evented_obj.event_emitter.emit(
     "event", "hello world", numbers=[1, 2, 3]
 )
 
-help(evented_obj)
\ No newline at end of file
+help(evented_obj)
+
+class logged:
+    # A decorator which exposes the function it wraps as `__wrapped__`
+    def __init__(self, f):
+        self.__wrapped__ = f
+
+    def __call__(self, *args, **kwargs):
+        print('logged')
+        return self.__wrapped__(*args, **kwargs)
+
+
+@evented
+class Decorated:
+    @logged
+    @on("event")
+    def event_handler(self, *args, **kwargs):
+        print('decorated handler', args, kwargs)
+
+    @on("event")
+    def second_handler(self, *args, **kwargs):
+        print('second handler, registered after the first')
+
+decorated_obj = Decorated()
+
+print(decorated_obj.event_emitter.emit("event", "hello world"))
+
+
+class NotEvented:
+    @on("event")
+    def event_handler(self, *args, **kwargs):
+        print('called directly', args, kwargs)
+
+NotEvented().event_handler("hello world")
@@ -0,0 +1,22 @@
+import sys
+sys.path.append('/workspace')
+from pyee import *
+
+ee = EventEmitter()
+
+@ee.on('new_listener')
+def new_listener_handler(event, f):
+    print('new listener for', event)
+
+def data_handler(data):
+    print('data', data)
+
+def end_handler():
+    print('end')
+
+ee.on_many((event, f) for event, f in [('data', data_handler), ('end', end_handler)])
+
+print(ee.event_names())
+
+ee.emit('data', '00101001')
+ee.emit('end')
@@ -0,0 +1,36 @@
+import sys
+sys.path.append('/workspace')
+from pyee import *
+
+ee = EventEmitter()
+
+def event_handler():
+    print('BANG BANG')
+
+ee.on('event', event_handler)
+
+# MicroPython has neither pickle nor weakref
+try:
+    import pickle
+except ImportError:
+    print('pickle not available')
+else:
+    copy = pickle.loads(pickle.dumps(ee))
+    copy.emit('event')
+    copy.on('other', event_handler)
+    print(copy.event_names())
+
+    class SlottedEventEmitter(EventEmitter):
+        __slots__ = ('name',)
+
+    slotted = SlottedEventEmitter()
+    slotted.name = 'slotted'
+    print(pickle.loads(pickle.dumps(slotted)).name)
+
+try:
+    import weakref
+except ImportError:
+    print('weakref not available')
+else:
+    ref = weakref.ref(ee)
+    print(ref() is ee)
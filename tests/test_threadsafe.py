@@ -0,0 +1,33 @@
+import sys
+sys.path.append('/workspace')
+from pyee import *
+import asyncio
+from pyee.asyncio import AsyncIOEventEmitter
+
+ee = EventEmitter(threadsafe=False)
+
+@ee.on('event')
+def event_handler():
+    print('BANG BANG')
+
+@ee.once('once')
+def once_handler():
+    print('only once')
+
+ee.emit('event')
+ee.emit('once')
+ee.emit('once')
+ee.remove_listener('event', event_handler)
+print(ee.emit('event'))
+
+ee_async = AsyncIOEventEmitter(threadsafe=False)
+
+@ee_async.on('event')
+async def async_handler():
+    print('async BANG BANG')
+
+async def main():
+    ee_async.emit('event')
+    await ee_async.wait_for_complete()
+
+asyncio.run(main())